@@ -2,9 +2,9 @@
 Interfaces de interoperabilidad para módulos Python en ADC Platform
 """
 
-from base_module import BaseModule, BaseUtility, BaseProvider, BaseService
-from ipc_client import IPCServer, IPCMessage
-from kernel_logger import KernelLogger, get_kernel_logger
+from .base_module import BaseModule, BaseUtility, BaseProvider, BaseService
+from .ipc_client import IPCServer, IPCMessage
+from .kernel_logger import KernelLogger, get_kernel_logger
 
 __all__ = [
     "BaseModule",
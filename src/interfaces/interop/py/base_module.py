@@ -4,19 +4,72 @@ Proporciona la estructura base para Utilities, Providers y Services.
 """
 
 import os
-import json
 import sys
-from abc import ABC, abstractmethod
+import copy
+import threading
+from abc import ABC
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
-from ipc_client import IPCServer
-from kernel_logger import get_kernel_logger
+
+# Imports relativos al importarse como paquete; top-level cuando el PythonLoader
+# ejecuta el módulo con este directorio en PYTHONPATH
+if __package__:
+    from .ipc_client import IPCServer
+    from .json_codec import JSONDecodeError, loads
+    from .kernel_logger import get_kernel_logger
+else:
+    from ipc_client import IPCServer
+    from json_codec import JSONDecodeError, loads
+    from kernel_logger import get_kernel_logger
+
+
+@dataclass(frozen=True)
+class _EnvConfig:
+    """Configuración del módulo recibida del kernel mediante variables de entorno"""
+
+    name: str
+    version: str
+    module_type: str
+    config: Dict[str, Any] = field(default_factory=dict)
+
+
+_ENV_CONFIG_CACHE: Optional[_EnvConfig] = None
+_ENV_CONFIG_LOCK = threading.Lock()
+
+
+def _get_env_config() -> _EnvConfig:
+    """Lee y parsea las variables ADC_* una sola vez por proceso"""
+    global _ENV_CONFIG_CACHE
+
+    if _ENV_CONFIG_CACHE is None:
+        with _ENV_CONFIG_LOCK:
+            if _ENV_CONFIG_CACHE is None:
+                environ = os.environ
+                config: Dict[str, Any] = {}
+                try:
+                    config = loads(environ.get("ADC_MODULE_CONFIG", "{}"))
+                except JSONDecodeError:
+                    get_kernel_logger("BaseModule").error("Error parseando ADC_MODULE_CONFIG")
+
+                _ENV_CONFIG_CACHE = _EnvConfig(
+                    name=environ.get("ADC_MODULE_NAME", "unknown"),
+                    version=environ.get("ADC_MODULE_VERSION", "1.0.0"),
+                    module_type=environ.get("ADC_MODULE_TYPE", "unknown"),
+                    config=config,
+                )
+
+    return _ENV_CONFIG_CACHE
 
 
 class BaseModule(ABC):
     """Clase base para todos los módulos Python"""
 
+    # Atributos públicos que no se exponen via IPC
+    _HANDLER_EXCLUDED = frozenset({"get_handler_methods", "start_ipc_server", "start", "stop", "name", "config", "logger"})
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
+        self._handler_cache: Optional[Dict[str, callable]] = None
         self._name: Optional[str] = None
         self._version: Optional[str] = None
         self._module_type: Optional[str] = None
@@ -29,44 +82,65 @@ class BaseModule(ABC):
         self.logger = get_kernel_logger(self._name)
 
     def _load_from_env(self) -> None:
-        """Carga la configuración desde variables de entorno"""
-        self._name = os.environ.get("ADC_MODULE_NAME", "unknown")
-        self._version = os.environ.get("ADC_MODULE_VERSION", "1.0.0")
-        self._module_type = os.environ.get("ADC_MODULE_TYPE", "unknown")
-
-        # Parsear configuración adicional
-        config_str = os.environ.get("ADC_MODULE_CONFIG", "{}")
-        try:
-            env_config = json.loads(config_str)
-            self.config.update(env_config)
-        except json.JSONDecodeError:
-            print(f"[BaseModule] Error parseando ADC_MODULE_CONFIG", file=sys.stderr)
+        """Carga la configuración desde variables de entorno (parseadas una vez por proceso)"""
+        env = _get_env_config()
+        self._name = env.name
+        self._version = env.version
+        self._module_type = env.module_type
+
+        # Copia profunda: cada instancia puede modificar su config (incluso anidada) sin afectar al cache
+        self.config.update(copy.deepcopy(env.config))
 
     @property
     def name(self) -> str:
         """Nombre del módulo"""
         return self._name or "unknown"
 
-    @abstractmethod
     def get_handler_methods(self) -> Dict[str, callable]:
         """
         Retorna un diccionario con los métodos que pueden ser llamados via IPC.
         Las claves son los nombres de los métodos y los valores son las funciones.
+        El resultado se calcula una sola vez recorriendo el MRO de la clase.
+        """
+        if self._handler_cache is None:
+            methods: Dict[str, callable] = {}
+            for klass in type(self).__mro__:
+                for attr_name, attr in vars(klass).items():
+                    if attr_name.startswith("_") or attr_name in self._HANDLER_EXCLUDED or attr_name in methods:
+                        continue
+                    # classmethod no es callable en el __dict__ de la clase; se evalúa el descriptor
+                    # en vez de usar getattr para no ejecutar properties
+                    if callable(attr) or isinstance(attr, (classmethod, staticmethod)):
+                        # Claves internadas, igual que los nombres de método de los mensajes IPC
+                        methods[sys.intern(attr_name)] = getattr(self, attr_name)
+            self._handler_cache = methods
+
+        return self._handler_cache
+
+    def start_ipc_server(self, handler_threads: int = 1) -> None:
         """
-        pass
+        Inicia el servidor IPC para este módulo (bloqueante).
 
-    def start_ipc_server(self) -> None:
-        """Inicia el servidor IPC para este módulo"""
-        ipc_server = IPCServer(self._name, self._version, "python")
+        Los métodos expuestos NO se ejecutan en el hilo principal: con `handler_threads` >= 1 corren
+        en hilos "ipc-handler" (con 1, de a una llamada a la vez aunque haya varios clientes).
+        El estado atado a un hilo creado en __init__ (conexiones sqlite3, signal.signal, threading.local)
+        no funciona desde ahí; esos módulos deben usar handler_threads=0, que ejecuta cada llamada
+        en el hilo principal a costa de frenar la E/S de los demás clientes mientras dura.
+        Con más de un hilo, los métodos del módulo deben ser thread-safe.
+
+        Args:
+            handler_threads: Hilos para ejecutar los métodos (0 = en el hilo principal)
+        """
+        ipc_server = IPCServer(self._name, self._version, "python", handler_threads)
 
         # Configurar el handler
         methods = self.get_handler_methods()
 
         def handler(method_name: str, args: list) -> Any:
-            if method_name not in methods:
+            method = methods.get(method_name)
+            if method is None:
                 raise AttributeError(f"Método '{method_name}' no encontrado en {self.name}")
 
-            method = methods[method_name]
             return method(*args)
 
         ipc_server.set_handler(handler)
@@ -87,22 +161,12 @@ class BaseModule(ABC):
 class BaseUtility(BaseModule):
     """Clase base para Utilities Python"""
 
-    def get_handler_methods(self) -> Dict[str, callable]:
-        """Obtiene los métodos públicos de esta instancia"""
-        methods = {}
-
-        for attr_name in dir(self):
-            if not attr_name.startswith("_") and attr_name not in ["get_handler_methods", "start_ipc_server", "start", "stop", "name", "config", "logger"]:
-                attr = getattr(self, attr_name)
-                if callable(attr):
-                    methods[attr_name] = attr
-
-        return methods
-
 
 class BaseProvider(BaseModule):
     """Clase base para Providers Python"""
 
+    _HANDLER_EXCLUDED = BaseModule._HANDLER_EXCLUDED | {"type", "provider_type"}
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.provider_type: Optional[str] = config.get("type") if config else None
@@ -112,30 +176,6 @@ class BaseProvider(BaseModule):
         """Tipo del provider"""
         return self.provider_type or "default"
 
-    def get_handler_methods(self) -> Dict[str, callable]:
-        """Obtiene los métodos públicos de esta instancia"""
-        methods = {}
-
-        for attr_name in dir(self):
-            if not attr_name.startswith("_") and attr_name not in ["get_handler_methods", "start_ipc_server", "start", "stop", "name", "config", "logger", "type", "provider_type"]:
-                attr = getattr(self, attr_name)
-                if callable(attr):
-                    methods[attr_name] = attr
-
-        return methods
-
 
 class BaseService(BaseModule):
     """Clase base para Services Python"""
-
-    def get_handler_methods(self) -> Dict[str, callable]:
-        """Obtiene los métodos públicos de esta instancia"""
-        methods = {}
-
-        for attr_name in dir(self):
-            if not attr_name.startswith("_") and attr_name not in ["get_handler_methods", "start_ipc_server", "start", "stop", "name", "config", "logger"]:
-                attr = getattr(self, attr_name)
-                if callable(attr):
-                    methods[attr_name] = attr
-
-        return methods
@@ -0,0 +1,28 @@
+# Declaraciones para compilar ipc_client.py con Cython (ver setup.py).
+
+
+cdef class IPCMessage:
+    cdef public object id, type, method, args, result, error, blobs
+
+
+cdef class IPCFrameBuffer:
+    cdef bytearray _buffer
+    cdef object _view
+    cdef Py_ssize_t _read_pos, _write_pos, _scan_pos
+
+    cpdef object get_buffer(self)
+    cpdef list feed(self, Py_ssize_t nbytes)
+    cdef _compact(self)
+    cdef _resize(self, Py_ssize_t size)
+
+
+# IPCConnection no se declara: debe heredar de asyncio.BufferedProtocol (clase Python),
+# así que el framing vive en IPCFrameBuffer
+
+
+cdef class IPCServer:
+    cdef public object module_name, module_version, language, handler_threads, handler, server, pipe_path
+    # Público para que IPCConnection (clase Python) pueda despachar al executor
+    cdef public object _executor
+
+    cpdef IPCMessage _process_message(self, IPCMessage message)
@@ -5,24 +5,88 @@ Compatible con Windows (named pipes) y Unix (Unix domain sockets).
 
 import os
 import sys
-import json
 import socket
-import tempfile
-import platform
-import base64
-from typing import Any, Callable, Dict, Optional
+import struct
+import queue
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional
 
-# Importar el logger del kernel
+# Imports relativos al importarse como paquete; top-level cuando el PythonLoader
+# ejecuta el módulo con este directorio en PYTHONPATH
+if __package__:
+    from .json_codec import dumps, loads
+    from .kernel_logger import get_kernel_logger, install_sigterm_flush
+else:
+    from json_codec import dumps, loads
+    from kernel_logger import get_kernel_logger, install_sigterm_flush
+
+
+# Codec tipado opcional para el header de los mensajes: decodifica directo a un Struct, sin dicts intermedios
 try:
-    from kernel_logger import get_kernel_logger
+    import msgspec
 except ImportError:
-    # Fallback si el logger no está disponible
-    class MockLogger:
-        def debug(self, msg): print(f"[DEBUG] {msg}", file=sys.stderr)
-        def info(self, msg): print(f"[INFO] {msg}", file=sys.stderr)
-        def warn(self, msg): print(f"[WARN] {msg}", file=sys.stderr)
-        def error(self, msg): print(f"[ERROR] {msg}", file=sys.stderr)
-    get_kernel_logger = lambda name: MockLogger()
+    msgspec = None
+
+if msgspec is not None:
+
+    class IPCWireMessage(msgspec.Struct):
+        """Esquema del header JSON de un mensaje IPC"""
+
+        # Sin restricción de tipo, igual que el decoder estándar (que tampoco lo valida)
+        id: Any = ""
+        type: str = ""
+        method: Optional[str] = None
+        args: Optional[list] = None
+        result: Any = None
+        error: Optional[str] = None
+
+    _HEADER_DECODER = msgspec.json.Decoder(IPCWireMessage)
+    _HEADER_ENCODER = msgspec.json.Encoder()
+else:
+    _HEADER_DECODER = None
+    _HEADER_ENCODER = None
+
+
+def _encode_nested_bytes(obj: Any) -> str:
+    """Codifica en base64 los bytes anidados en un resultado, igual que hace msgspec"""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        import base64
+
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Tipo no serializable a JSON: {type(obj).__name__}")
+
+
+# Trama binaria: magic + longitud del header JSON + longitud total de blobs (uint32 LE),
+# seguida del header y de los buffers crudos concatenados en orden de índice.
+# Un mensaje JSON nunca empieza con 0x00, así que conviven con las tramas legacy por newline.
+BINARY_FRAME_MAGIC = 0x00
+BINARY_FRAME_PREFIX = struct.Struct("<BII")
+
+# sys.platform no requiere importar el módulo platform (que puede cargar subprocess)
+IS_WINDOWS = sys.platform == "win32"
+
+# Tamaño de los buffers del kernel por conexión (favorece transferencias grandes de Buffers)
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Por debajo de este tamaño total de blobs la trama se arma en un solo bytes:
+# copiar unos KB es más barato que una escritura (y un syscall) extra
+FRAME_JOIN_THRESHOLD = 64 << 10
+
+# Antes de 3.12, Transport.writelines concatena las partes con b"".join (copia los blobs);
+# en ese caso se escribe cada parte por separado
+WRITELINES_JOINS = sys.version_info < (3, 12)
+
+# Buffer de recepción preasignado por conexión; crece al doble si una trama no entra
+# y vuelve a este tamaño cuando queda vacío
+RECV_BUFFER_SIZE = 1 << 20
+
+# Espacio libre mínimo a ofrecer en cada lectura antes de compactar o crecer el buffer
+RECV_MIN_FREE = 64 << 10
+
+# Tramas recibidas y aún sin procesar a partir de las cuales se deja de leer del socket
+MAX_QUEUED_FRAMES = 32
 
 
 class IPCMessage:
@@ -36,6 +100,7 @@ class IPCMessage:
         args: Optional[list] = None,
         result: Any = None,
         error: Optional[str] = None,
+        blobs: Optional[memoryview] = None,
     ):
         self.id = msg_id
         self.type = msg_type
@@ -43,15 +108,29 @@ class IPCMessage:
         self.args = args or []
         self.result = result
         self.error = error
+        self.blobs = blobs
+
+    def to_dict(self, blobs: Optional[list] = None) -> dict:
+        """
+        Convierte el mensaje a diccionario.
+        Un resultado bytes se agrega a `blobs` y se referencia por índice; sin `blobs` se codifica en base64.
+        """
+        result = self.result
+        if isinstance(result, bytes):
+            if blobs is None:
+                import base64  # Solo lo necesita el formato legacy
+
+                result = {"__type": "Buffer", "data": base64.b64encode(result).decode("utf-8")}
+            else:
+                blobs.append(result)
+                result = {"__type": "Buffer", "idx": len(blobs) - 1, "len": len(result)}
 
-    def to_dict(self) -> dict:
-        """Convierte el mensaje a diccionario"""
         return {
             "id": self.id,
             "type": self.type,
             "method": self.method,
             "args": self.args,
-            "result": self.result,
+            "result": result,
             "error": self.error,
         }
 
@@ -67,18 +146,332 @@ class IPCMessage:
             error=data.get("error"),
         )
 
+    def _encode_header(self, blobs: Optional[list] = None) -> bytes:
+        """Serializa el header JSON del mensaje (con msgspec si está disponible)"""
+        data = self.to_dict(blobs)
+        if _HEADER_ENCODER is None:
+            # Sin msgspec, los bytes anidados se codifican igual que con él (base64)
+            return dumps(data, default=_encode_nested_bytes)
+        return _HEADER_ENCODER.encode(data)
+
+    @staticmethod
+    def _decode_header(header: bytes) -> "IPCMessage":
+        """Crea un mensaje desde su header JSON (con msgspec si está disponible)"""
+        if _HEADER_DECODER is None:
+            message = IPCMessage.from_dict(loads(header))
+        else:
+            wire = _HEADER_DECODER.decode(header)
+            message = IPCMessage(wire.id, wire.type, wire.method, wire.args, wire.result, wire.error)
+
+        # Internados, la comparación de tipo y el lookup del handler se resuelven por identidad
+        # (sin msgspec el header no se valida, así que se descartan valores que no sean str)
+        if isinstance(message.type, str):
+            message.type = sys.intern(message.type)
+        if isinstance(message.method, str):
+            message.method = sys.intern(message.method)
+        return message
+
+    def to_frame_parts(self, binary: bool) -> List[bytes]:
+        """
+        Serializa el mensaje como trama binaria o como línea JSON (formato legacy).
+        Prefijo, header y newline van juntos en la primera parte; solo los blobs grandes
+        se devuelven por separado, para enviarlos sin copiarlos.
+        """
+        if not binary:
+            return [self._encode_header() + b"\n"]
+
+        blobs: list = []
+        header = self._encode_header(blobs)
+        blobs_len = sum(map(len, blobs))
+        head = BINARY_FRAME_PREFIX.pack(BINARY_FRAME_MAGIC, len(header), blobs_len) + header
+        if blobs_len < FRAME_JOIN_THRESHOLD:
+            return [b"".join([head, *blobs])]
+        return [head, *blobs]
+
+    @staticmethod
+    def _frame_header(frame: bytes, binary: bool) -> bytes:
+        """Extrae el header JSON de una trama completa"""
+        if not binary:
+            return frame
+        _, header_len, _ = BINARY_FRAME_PREFIX.unpack_from(frame)
+        return frame[BINARY_FRAME_PREFIX.size : BINARY_FRAME_PREFIX.size + header_len]
+
+    @staticmethod
+    def from_frame(frame: bytes, binary: bool) -> "IPCMessage":
+        """Crea un mensaje desde una trama completa"""
+        header = IPCMessage._frame_header(frame, binary)
+        message = IPCMessage._decode_header(header)
+        if binary:
+            message.blobs = memoryview(frame)[BINARY_FRAME_PREFIX.size + len(header) :]
+        return message
+
+    @staticmethod
+    def invalid_frame_error(frame: bytes, binary: bool, error: Exception) -> "IPCMessage":
+        """
+        Crea la respuesta de error para una trama cuyo header no se pudo decodificar.
+        Recupera el id si el header es JSON válido, para que el cliente no espere hasta el timeout.
+        """
+        msg_id: Any = ""
+        try:
+            data = loads(IPCMessage._frame_header(frame, binary))
+            if isinstance(data, dict):
+                msg_id = data.get("id", "")
+        except Exception:
+            pass
+        return IPCMessage(msg_id=msg_id, msg_type="error", error=f"Mensaje inválido: {error}")
+
+    def decode_args(self) -> list:
+        """Reconstruye los buffers de los argumentos, ya sea desde base64 o desde los blobs de la trama"""
+        args = []
+        offset = 0
+        for arg in self.args:
+            if isinstance(arg, dict) and arg.get("__type") == "Buffer":
+                if "data" in arg:
+                    import base64  # Solo lo necesita el formato legacy
+
+                    args.append(base64.b64decode(arg["data"]))
+                else:
+                    end = offset + arg["len"]
+                    args.append(self.blobs[offset:end].tobytes())
+                    offset = end
+            else:
+                args.append(arg)
+        return args
+
+
+class IPCFrameBuffer:
+    """
+    Buffer de recepción preasignado de una conexión.
+    El event loop escribe directo en él con recv_into; las tramas completas se copian una
+    sola vez al extraerlas. Separado de IPCConnection para poder tiparlo con Cython.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._read_pos = 0
+        self._write_pos = 0
+        # Hasta dónde ya se buscó el newline de la línea legacy en curso
+        self._scan_pos = 0
+
+    def get_buffer(self) -> memoryview:
+        """Devuelve el espacio libre donde recibir, compactando o creciendo si hace falta"""
+        capacity = len(self._buffer)
+        if self._read_pos > capacity // 2 or capacity - self._write_pos < RECV_MIN_FREE:
+            if capacity - (self._write_pos - self._read_pos) < RECV_MIN_FREE:
+                # Ni compactando queda espacio: la trama en curso no entra
+                self._resize(capacity * 2)
+            else:
+                self._compact()
+        return self._view[self._write_pos :]
+
+    def feed(self, nbytes: int) -> list:
+        """Registra `nbytes` recibidos y devuelve las tramas completas como (trama, binaria)"""
+        self._write_pos += nbytes
+        buffer, view = self._buffer, self._view
+        frames = []
+
+        while self._read_pos < self._write_pos:
+            start = self._read_pos
+
+            if buffer[start] == BINARY_FRAME_MAGIC:
+                if self._write_pos - start < BINARY_FRAME_PREFIX.size:
+                    break
+                _, header_len, blobs_len = BINARY_FRAME_PREFIX.unpack_from(buffer, start)
+                end = start + BINARY_FRAME_PREFIX.size + header_len + blobs_len
+                if end > self._write_pos:
+                    break
+                frames.append((bytes(view[start:end]), True))
+                self._read_pos = end
+            else:
+                newline = buffer.find(b"\n", max(start, self._scan_pos), self._write_pos)
+                if newline == -1:
+                    self._scan_pos = self._write_pos
+                    break
+                if newline > start:
+                    frames.append((bytes(view[start:newline]), False))
+                self._read_pos = newline + 1
+
+        if self._read_pos == self._write_pos:
+            self._read_pos = self._write_pos = self._scan_pos = 0
+            # Una trama grande no deja el buffer agrandado por el resto de la conexión
+            if len(self._buffer) > RECV_BUFFER_SIZE:
+                self._resize(RECV_BUFFER_SIZE)
+
+        return frames
+
+    def _compact(self):
+        """Mueve los bytes pendientes al inicio del buffer"""
+        pending = self._write_pos - self._read_pos
+        self._buffer[:pending] = self._buffer[self._read_pos : self._write_pos]
+        self._scan_pos -= self._read_pos
+        self._read_pos, self._write_pos = 0, pending
+
+    def _resize(self, size: int):
+        """Reemplaza el buffer por uno de `size` bytes, con los bytes pendientes al inicio"""
+        pending = self._write_pos - self._read_pos
+        buffer = bytearray(size)
+        buffer[:pending] = self._view[self._read_pos : self._write_pos]
+        self._buffer, self._view = buffer, memoryview(buffer)
+        self._scan_pos -= self._read_pos
+        self._read_pos, self._write_pos = 0, pending
+
+
+class IPCConnection(asyncio.BufferedProtocol):
+    """
+    Conexión de un cliente del IPCServer.
+    Recibe sobre un IPCFrameBuffer y procesa las tramas en orden. Deja de leer si se acumulan
+    tramas sin procesar y espera a que el transporte se descargue antes de escribir.
+    """
+
+    def __init__(self, server: "IPCServer"):
+        self._server = server
+        self._logger = get_kernel_logger(server.module_name)
+        self._transport: Optional[asyncio.Transport] = None
+        self._frames: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._reader = IPCFrameBuffer()
+        self._reading_paused = False
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        try:
+            self._server._configure_client_socket(transport.get_extra_info("socket"))
+        except Exception as e:
+            self._logger.debug(f"Error configurando socket del cliente: {e}")
+        self._worker = asyncio.get_running_loop().create_task(self._process_frames())
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # Las tramas ya recibidas se procesan igual; None marca el fin de la conexión
+        self._can_write.set()
+        self._frames.put_nowait(None)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._reader.get_buffer()
+
+    def buffer_updated(self, nbytes: int) -> None:
+        for frame in self._reader.feed(nbytes):
+            self._frames.put_nowait(frame)
+
+        if not self._reading_paused and self._frames.qsize() >= MAX_QUEUED_FRAMES:
+            self._reading_paused = True
+            self._transport.pause_reading()
+
+    def _send(self, parts: List[bytes]) -> None:
+        """Escribe las partes de una trama sin concatenarlas"""
+        if WRITELINES_JOINS:
+            for part in parts:
+                self._transport.write(part)
+        else:
+            self._transport.writelines(parts)
+
+    async def _dispatch(self, message: IPCMessage) -> IPCMessage:
+        """Ejecuta el handler en los hilos del servidor, o en el del event loop si no tiene"""
+        server = self._server
+        if server._executor is None:
+            return server._process_message(message)
+        return await asyncio.get_running_loop().run_in_executor(server._executor, server._process_message, message)
+
+    async def _process_frames(self) -> None:
+        """Procesa las tramas de a una para responder en el mismo orden en que llegaron"""
+        while True:
+            item = await self._frames.get()
+            if item is None:
+                break
+
+            if self._reading_paused and self._frames.qsize() < MAX_QUEUED_FRAMES // 2:
+                self._reading_paused = False
+                self._transport.resume_reading()
+
+            frame, binary = item
+            if not binary and not frame.strip():
+                continue
+
+            try:
+                try:
+                    message = IPCMessage.from_frame(frame, binary)
+                except Exception as e:
+                    response = IPCMessage.invalid_frame_error(frame, binary, e)
+                else:
+                    response = await self._dispatch(message)
+
+                try:
+                    parts = response.to_frame_parts(binary)
+                except (TypeError, ValueError) as e:
+                    # Resultado no serializable: se responde el error en vez de dejar al cliente esperando
+                    error = IPCMessage(msg_id=response.id, msg_type="error", error=f"Resultado no serializable: {e}")
+                    parts = error.to_frame_parts(binary)
+
+                await self._can_write.wait()
+                if not self._transport.is_closing():
+                    self._send(parts)
+            except Exception as e:
+                # La petición queda sin respuesta: este log es el único rastro
+                self._logger.error(f"Error procesando mensaje: {e}")
+
+
+class _HandlerExecutor(Executor):
+    """
+    Executor mínimo con hilos daemon para los handlers. A diferencia de ThreadPoolExecutor,
+    el intérprete no espera a sus hilos al salir: un handler colgado no impide terminar el proceso.
+    """
+
+    def __init__(self, max_workers: int):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"ipc-handler-{i}", daemon=True) for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
 
 class IPCServer:
     """
     Servidor IPC que escucha peticiones desde Node.js y las enruta a un handler.
     """
 
-    def __init__(self, module_name: str, module_version: str, language: str = "python"):
+    def __init__(self, module_name: str, module_version: str, language: str = "python", handler_threads: int = 1):
         self.module_name = module_name
         self.module_version = module_version
         self.language = language
+        # Hilos que ejecutan el handler; 0 lo ejecuta en el hilo del event loop (ver BaseModule.start_ipc_server)
+        self.handler_threads = handler_threads
         self.handler: Optional[Callable] = None
-        self.socket: Optional[socket.socket] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[_HandlerExecutor] = None
         self.pipe_path = self._get_pipe_path()
 
     def _get_pipe_path(self) -> str:
@@ -87,9 +480,11 @@ class IPCServer:
         safe_module_name = self.module_name.replace("/", "-").replace("\\", "-")
         pipe_name = f"{safe_module_name}-{self.module_version}-{self.language}"
 
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             return f"\\\\.\\pipe\\{pipe_name}"
         else:
+            import tempfile  # Solo se usa una vez, al resolver la ruta del socket
+
             base_path = os.path.join(tempfile.gettempdir(), "adc-platform")
             os.makedirs(base_path, exist_ok=True)
             pipe_path = os.path.join(base_path, pipe_name)
@@ -110,74 +505,66 @@ class IPCServer:
         self.handler = handler
 
     def start(self) -> None:
-        """Inicia el servidor IPC"""
+        """Inicia el servidor IPC (bloqueante)"""
         logger = get_kernel_logger(self.module_name)
-        
+
         if not self.handler:
             raise RuntimeError("Debe establecer un handler antes de iniciar el servidor")
 
-        try:
-            # Crear socket Unix o named pipe
-            if platform.system() == "Windows":
-                # En Windows, usar named pipes nativos (requiere pywin32)
-                # Por simplicidad, aquí usamos sockets TCP local
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                # TODO: Implementar named pipes nativos de Windows con pywin32
-                logger.warn("Named pipes de Windows no implementados, usando TCP")
-                self.socket.bind(("localhost", 0))
-            else:
-                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self.socket.bind(self.pipe_path)
-
-            self.socket.listen(5)
-            logger.ok(f"Servidor iniciado en {self.pipe_path}")
-
-            # Bucle principal de escucha
-            while True:
-                try:
-                    client_socket, _ = self.socket.accept()
-                    self._handle_client(client_socket)
-                except KeyboardInterrupt:
-                    break
-                except Exception as e:
-                    logger.error(f"Error aceptando cliente: {e}")
+        # Desde aquí el proceso vive hasta que el PythonLoader lo detenga con SIGTERM
+        install_sigterm_flush()
 
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            pass
         except Exception as e:
             logger.error(f"Error iniciando servidor: {e}")
             raise
         finally:
             self.stop()
 
-    def _handle_client(self, client_socket: socket.socket) -> None:
-        """Maneja una conexión de cliente"""
+    async def _serve(self) -> None:
+        """Acepta clientes concurrentemente hasta que se cancele el servidor"""
         logger = get_kernel_logger(self.module_name)
-        buffer = ""
+        loop = asyncio.get_running_loop()
+
+        # Con hilos, los handlers corren fuera del event loop y no bloquean la E/S del resto de los clientes
+        if self.handler_threads > 0:
+            self._executor = _HandlerExecutor(self.handler_threads)
 
         try:
-            while True:
-                data = client_socket.recv(4096)
-                if not data:
-                    break
+            # Crear socket Unix o named pipe
+            if IS_WINDOWS:
+                # En Windows, usar named pipes nativos (requiere pywin32)
+                # Por simplicidad, aquí usamos sockets TCP local
+                # TODO: Implementar named pipes nativos de Windows con pywin32
+                logger.warn("Named pipes de Windows no implementados, usando TCP")
+                self.server = await loop.create_server(lambda: IPCConnection(self), "localhost", 0)
+            else:
+                self.server = await loop.create_unix_server(lambda: IPCConnection(self), path=self.pipe_path)
 
-                buffer += data.decode("utf-8")
+            logger.ok(f"Servidor iniciado en {self.pipe_path}")
 
-                # Procesar mensajes completos (separados por newline)
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    if not line.strip():
-                        continue
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
 
-                    try:
-                        message = IPCMessage.from_dict(json.loads(line))
-                        response = self._process_message(message)
-                        client_socket.sendall((json.dumps(response.to_dict()) + "\n").encode("utf-8"))
-                    except Exception as e:
-                        logger.debug(f"Error procesando mensaje: {e}")
+    def _configure_client_socket(self, client_socket: socket.socket) -> None:
+        """Ajusta las opciones de socket de una conexión aceptada"""
+        # Sin Nagle: las respuestas son tramas chicas de request/response que no deben esperar
+        if client_socket.family in (socket.AF_INET, socket.AF_INET6):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-        except Exception as e:
-            logger.debug(f"Error manejando cliente: {e}")
-        finally:
-            client_socket.close()
+        for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+            try:
+                client_socket.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+            except OSError:
+                # El SO puede rechazar o limitar el tamaño; se mantiene el valor por defecto
+                pass
 
     def _process_message(self, message: IPCMessage) -> IPCMessage:
         """Procesa un mensaje de request y genera una response"""
@@ -188,21 +575,9 @@ class IPCServer:
             return IPCMessage(msg_id=message.id, msg_type="error", error="Método no especificado")
 
         try:
-            # Deserializar buffers en los argumentos
-            args = []
-            for arg in message.args:
-                if isinstance(arg, dict) and arg.get("__type") == "Buffer":
-                    args.append(base64.b64decode(arg["data"]))
-                else:
-                    args.append(arg)
-            
             # Llamar al handler con el método y argumentos
-            result = self.handler(message.method, args)
-            
-            # Convertir bytes a base64 para serialización JSON
-            if isinstance(result, bytes):
-                result = {"__type": "Buffer", "data": base64.b64encode(result).decode('utf-8')}
-            
+            result = self.handler(message.method, message.decode_args())
+
             return IPCMessage(msg_id=message.id, msg_type="response", result=result)
         except Exception as e:
             return IPCMessage(msg_id=message.id, msg_type="error", error=str(e))
@@ -211,12 +586,12 @@ class IPCServer:
         """Detiene el servidor IPC"""
         logger = get_kernel_logger(self.module_name)
         
-        if self.socket:
-            self.socket.close()
-            self.socket = None
+        if self.server:
+            self.server.close()
+            self.server = None
 
         # Limpiar el archivo de socket en Unix
-        if platform.system() != "Windows" and os.path.exists(self.pipe_path):
+        if not IS_WINDOWS and os.path.exists(self.pipe_path):
             try:
                 os.unlink(self.pipe_path)
             except OSError:
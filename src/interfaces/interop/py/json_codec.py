@@ -0,0 +1,56 @@
+"""
+Codec JSON compartido por los módulos Python de ADC Platform.
+Usa orjson si está instalado y recurre a la librería estándar en caso contrario.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError hereda de json.JSONDecodeError, así que basta con capturar esta
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(data: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serializa datos a JSON codificado en UTF-8.
+
+    Args:
+        data: Los datos a serializar
+        indent: Si es True, indenta la salida con 2 espacios
+        default: Convierte los objetos no serializables (debe lanzar TypeError si no puede)
+
+    Returns:
+        bytes: El JSON serializado
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=default).encode("utf-8")
+
+
+def loads(buffer: Union[bytes, bytearray, memoryview]) -> Any:
+    """
+    Deserializa JSON directamente desde bytes, sin decodificar a str primero.
+
+    Args:
+        buffer: Los bytes en formato JSON UTF-8
+
+    Returns:
+        Any: Los datos deserializados
+    """
+    if orjson is not None:
+        return orjson.loads(buffer)
+    # json.loads acepta bytes y bytearray, pero no memoryview
+    if isinstance(buffer, memoryview):
+        buffer = buffer.tobytes()
+    return json.loads(buffer)
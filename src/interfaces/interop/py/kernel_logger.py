@@ -5,8 +5,85 @@ Permite que los módulos Python registren logs con los mismos niveles que el ker
 
 import os
 import sys
+import atexit
+import signal
+import threading
+from collections import deque
 from typing import Optional
 
+# Las líneas se acumulan en memoria y un hilo daemon las vuelca a stderr en lote,
+# cada LOG_FLUSH_INTERVAL segundos o antes si se juntan más de LOG_FLUSH_THRESHOLD
+LOG_FLUSH_INTERVAL = 0.01
+LOG_FLUSH_THRESHOLD = 64
+
+_log_buffer: deque = deque()
+# Reentrantes: el handler de SIGTERM vuelca desde el hilo principal, que puede tenerlos tomados
+_log_lock = threading.RLock()
+_flush_lock = threading.RLock()
+_log_pending = threading.Event()
+_log_full = threading.Event()
+_log_flusher: Optional[threading.Thread] = None
+
+
+def _enqueue_log(line: str) -> None:
+    """Agrega una línea al buffer y despierta al hilo de volcado si hace falta"""
+    global _log_flusher
+
+    with _log_lock:
+        _log_buffer.append(line)
+        pending = len(_log_buffer)
+        if _log_flusher is None:
+            _log_flusher = threading.Thread(target=_flush_loop, name="kernel-logger", daemon=True)
+            _log_flusher.start()
+
+    if pending == 1:
+        _log_pending.set()
+    elif pending > LOG_FLUSH_THRESHOLD:
+        _log_full.set()
+
+
+def _flush_loop() -> None:
+    """Espera a que haya líneas pendientes y las vuelca tras el intervalo o al llenarse el lote"""
+    while True:
+        _log_pending.wait()
+        _log_full.wait(LOG_FLUSH_INTERVAL)
+        _log_pending.clear()
+        _log_full.clear()
+        flush_logs()
+
+
+def flush_logs() -> None:
+    """Escribe a stderr todas las líneas pendientes con una sola escritura"""
+    # _flush_lock mantiene el orden si el hilo de volcado y atexit coinciden
+    with _flush_lock:
+        with _log_lock:
+            if not _log_buffer:
+                return
+            data = "".join(_log_buffer)
+            _log_buffer.clear()
+        sys.stderr.write(data)
+
+
+# Al salir se vuelca lo que quede en el buffer (el hilo daemon no llega a hacerlo)
+atexit.register(flush_logs)
+
+
+def _flush_and_terminate(signum, frame) -> None:
+    """Vuelca el buffer y termina con la acción por defecto de la señal, sin esperar a nadie"""
+    flush_logs()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def install_sigterm_flush() -> None:
+    """
+    Vuelca los logs pendientes al recibir SIGTERM (con la que el PythonLoader detiene los módulos),
+    ya que la acción por defecto no ejecuta atexit. Solo desde el hilo principal y sin pisar
+    un handler propio del módulo.
+    """
+    if threading.current_thread() is threading.main_thread() and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _flush_and_terminate)
+
 
 class KernelLogger:
     """
@@ -23,36 +100,55 @@ class KernelLogger:
         "error": "ERROR",
     }
 
+    # Prioridad de cada nivel (misma escala que el ConsoleLogger del kernel)
+    LOG_PRIORITIES = {
+        "debug": 0,
+        "info": 1,
+        "ok": 2,
+        "warn": 3,
+        "error": 4,
+        "none": 5,
+    }
+
     def __init__(self, module_name: str):
         self.module_name = module_name
         self.log_level = os.environ.get("ADC_LOG_LEVEL", "info").lower()
 
+        # Precalcular qué niveles se emiten y el prefijo
+        threshold = self.LOG_PRIORITIES.get(self.log_level, self.LOG_PRIORITIES["info"])
+        self._enabled = {label: self.LOG_PRIORITIES[level] >= threshold for level, label in self.LOG_LEVELS.items()}
+        self._prefix = f"[{module_name}] "
+
     def _format_message(self, level: str, message: str) -> str:
         """Formatea el mensaje con el módulo y nivel"""
-        return f"[{self.module_name}] {message}"
+        return self._prefix + message
 
     def _write_log(self, level: str, message: str) -> None:
         """Escribe el log a stderr en un formato que el kernel pueda capturar"""
         # El formato es: [LEVEL] [module_name] mensaje
         # Para que el kernel Node.js lo capture y lo formattee correctamente
-        formatted = self._format_message(level, message)
-        print(formatted, file=sys.stderr)
+        # El nivel ya lo filtró el método público; la línea se vuelca en lote desde el hilo del logger
+        _enqueue_log(self._format_message(level, message) + "\n")
 
     def debug(self, message: str) -> None:
         """Log de nivel DEBUG"""
-        self._write_log(self.LOG_LEVELS["debug"], message)
+        if self._enabled["DEBUG"]:
+            self._write_log("DEBUG", message)
 
     def info(self, message: str) -> None:
         """Log de nivel INFO"""
-        self._write_log(self.LOG_LEVELS["info"], message)
+        if self._enabled["INFO"]:
+            self._write_log("INFO", message)
 
     def ok(self, message: str) -> None:
         """Log de nivel OK (éxito)"""
-        self._write_log(self.LOG_LEVELS["ok"], message)
+        if self._enabled["OK"]:
+            self._write_log("OK", message)
 
     def warn(self, message: str) -> None:
         """Log de nivel WARN (advertencia)"""
-        self._write_log(self.LOG_LEVELS["warn"], message)
+        if self._enabled["WARN"]:
+            self._write_log("WARN", message)
 
     def warning(self, message: str) -> None:
         """Alias para warn()"""
@@ -60,7 +156,8 @@ class KernelLogger:
 
     def error(self, message: str) -> None:
         """Log de nivel ERROR"""
-        self._write_log(self.LOG_LEVELS["error"], message)
+        if self._enabled["ERROR"]:
+            self._write_log("ERROR", message)
 
 
 def get_kernel_logger(module_name: Optional[str] = None) -> KernelLogger:
@@ -0,0 +1,23 @@
+"""
+Compilación opcional de ipc_client con Cython.
+
+Uso (desde este directorio):
+    python3 setup.py build_ext --inplace
+
+El módulo compilado tiene prioridad sobre ipc_client.py al importar; si no existe,
+Python carga la versión pura sin cambios. Los tipos C se declaran en ipc_client.pxd.
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="adc-platform-interop-py",
+    ext_modules=cythonize(
+        # Nombre explícito: los módulos se importan como top-level vía PYTHONPATH, no como paquete
+        [Extension("ipc_client", ["ipc_client.py"])],
+        language_level=3,
+        # Las anotaciones del .py son documentales; los tipos C vienen del .pxd
+        compiler_directives={"annotation_typing": False},
+    ),
+)
@@ -4,12 +4,13 @@ JsonFileAdapter - Utility para convertir datos JSON a/desde buffers.
 Versión 1.0.0-py - Implementación en Python con interoperabilidad IPC.
 """
 
-import json
+import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 # Importar las interfaces base de ADC Platform
 from base_module import BaseUtility
+from json_codec import JSONDecodeError, dumps, loads
 from kernel_logger import get_kernel_logger
 
 
@@ -21,38 +22,62 @@ class JsonAdapterUtility(BaseUtility):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
+        # ADC_JSON_PRETTY=1 fuerza salida indentada en todas las llamadas (útil para depurar)
+        self._pretty = os.environ.get("ADC_JSON_PRETTY", "").lower() in ("1", "true")
+        # ADC_JSON_VALIDATE=1 valida los payloads ya codificados que llegan a to_buffer (útil para depurar)
+        self._validate = os.environ.get("ADC_JSON_VALIDATE", "").lower() in ("1", "true")
 
-    def toBuffer(self, data: Any) -> bytes:
+    def toBuffer(self, data: Any, pretty: bool = False) -> bytes:
         """Alias camelCase para TypeScript"""
-        return self.to_buffer(data)
+        return self.to_buffer(data, pretty)
 
-    def to_buffer(self, data: Any) -> bytes:
+    def to_buffer(self, data: Any, pretty: bool = False) -> bytes:
         """
-        Convierte datos a bytes (buffer) en formato JSON.
+        Convierte datos a bytes (buffer) en formato JSON compacto.
+
+        Si `data` ya es bytes, bytearray o memoryview se asume JSON UTF-8 ya codificado
+        y se devuelve tal cual (sin parsear ni re-serializar, e ignorando `pretty`).
 
         Args:
-            data: Los datos a convertir (cualquier objeto serializable a JSON)
+            data: Los datos a convertir (cualquier objeto serializable a JSON, o JSON ya codificado)
+            pretty: Si es True, indenta la salida con 2 espacios
 
         Returns:
             bytes: Los datos serializados como bytes UTF-8
         """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if self._validate:
+                try:
+                    loads(data)
+                except ValueError as e:  # JSON inválido o UTF-8 inválido
+                    self.logger.error(f"Buffer recibido no es JSON válido: {e}")
+                    return b""
+            return bytes(data)
+
         try:
-            json_string = json.dumps(data, indent=2, ensure_ascii=False)
-            return json_string.encode("utf-8")
+            return dumps(data, indent=pretty or self._pretty)
         except Exception as e:
             self.logger.error(f"Error al serializar a Buffer: {e}")
             return b""
 
-    def fromBuffer(self, buffer: bytes) -> Any:
+    def toBufferPretty(self, data: Any) -> bytes:
+        """Alias camelCase para TypeScript"""
+        return self.to_buffer_pretty(data)
+
+    def to_buffer_pretty(self, data: Any) -> bytes:
+        """Convierte datos a bytes en formato JSON indentado, legible para humanos"""
+        return self.to_buffer(data, pretty=True)
+
+    def fromBuffer(self, buffer: Union[bytes, bytearray, memoryview]) -> Any:
         """Alias camelCase para TypeScript"""
         return self.from_buffer(buffer)
 
-    def from_buffer(self, buffer: bytes) -> Any:
+    def from_buffer(self, buffer: Union[bytes, bytearray, memoryview]) -> Any:
         """
-        Convierte bytes (buffer) a datos Python parseando JSON.
+        Convierte bytes (buffer) a datos Python parseando JSON, sin decodificar a str primero.
 
         Args:
-            buffer: Los bytes en formato JSON UTF-8
+            buffer: Los bytes en formato JSON UTF-8 (bytes, bytearray o memoryview)
 
         Returns:
             Any: Los datos deserializados
@@ -66,9 +91,8 @@ class JsonAdapterUtility(BaseUtility):
             raise ValueError(error_msg)
 
         try:
-            json_string = buffer.decode("utf-8")
-            return json.loads(json_string)
-        except json.JSONDecodeError as e:
+            return loads(buffer)
+        except JSONDecodeError as e:
             error_msg = f"Error al parsear JSON: {e}"
             self.logger.error(error_msg)
             raise ValueError(error_msg)
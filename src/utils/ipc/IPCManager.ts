@@ -23,6 +23,100 @@ interface IPCMessage {
 	error?: string;
 }
 
+/**
+ * Trama recibida: header JSON y, en tramas binarias, la región de buffers crudos
+ */
+interface IPCFrame {
+	header: string;
+	blobs?: Buffer;
+}
+
+/**
+ * Trama binaria: magic + longitud del header JSON + longitud total de blobs (uint32 LE),
+ * seguida del header y de los buffers crudos concatenados en orden de índice.
+ * Un mensaje JSON nunca empieza con 0x00, así que conviven con las tramas legacy por newline.
+ */
+const BINARY_FRAME_MAGIC = 0x00;
+const BINARY_FRAME_PREFIX_SIZE = 9;
+
+/** Lenguajes cuyos servidores IPC aceptan tramas binarias (el resto usa JSON + base64) */
+const BINARY_FRAME_LANGUAGES = new Set(["python"]);
+
+/**
+ * Serializa un mensaje como trama binaria, enviando los buffers sin codificar
+ */
+function encodeBinaryFrame(message: IPCMessage, blobs: Buffer[]): Buffer {
+	const header = Buffer.from(JSON.stringify(message), "utf-8");
+	const prefix = Buffer.allocUnsafe(BINARY_FRAME_PREFIX_SIZE);
+	prefix.writeUInt8(BINARY_FRAME_MAGIC, 0);
+	prefix.writeUInt32LE(header.byteLength, 1);
+	prefix.writeUInt32LE(blobs.reduce((total, blob) => total + blob.byteLength, 0), 5);
+	return Buffer.concat([prefix, header, ...blobs]);
+}
+
+/**
+ * Extrae las tramas completas del buffer (binarias o separadas por newline) y devuelve el resto sin procesar
+ */
+function decodeFrames(buffer: Buffer): { frames: IPCFrame[]; rest: Buffer } {
+	const frames: IPCFrame[] = [];
+	let offset = 0;
+
+	while (offset < buffer.byteLength) {
+		if (buffer[offset] === BINARY_FRAME_MAGIC) {
+			if (buffer.byteLength - offset < BINARY_FRAME_PREFIX_SIZE) break;
+			const headerStart = offset + BINARY_FRAME_PREFIX_SIZE;
+			const headerEnd = headerStart + buffer.readUInt32LE(offset + 1);
+			const frameEnd = headerEnd + buffer.readUInt32LE(offset + 5);
+			if (buffer.byteLength < frameEnd) break;
+
+			frames.push({ header: buffer.toString("utf-8", headerStart, headerEnd), blobs: buffer.subarray(headerEnd, frameEnd) });
+			offset = frameEnd;
+		} else {
+			const newline = buffer.indexOf(0x0a, offset);
+			if (newline === -1) break;
+
+			const header = buffer.toString("utf-8", offset, newline);
+			if (header.trim()) frames.push({ header });
+			offset = newline + 1;
+		}
+	}
+
+	return { frames, rest: buffer.subarray(offset) };
+}
+
+/**
+ * Acumula los chunks recibidos y solo los concatena cuando puede haber una trama completa:
+ * una trama binaria grande se junta una sola vez en vez de re-concatenarse en cada chunk
+ */
+class FrameReader {
+	#chunks: Buffer[] = [];
+	#length = 0;
+	/** Bytes necesarios para completar la trama binaria en curso (0 si no hay una) */
+	#needed = 0;
+
+	push(data: Buffer): IPCFrame[] {
+		this.#chunks.push(data);
+		this.#length += data.byteLength;
+
+		if (this.#length < this.#needed) return [];
+		// Una línea legacy pendiente solo se completa si el chunk nuevo trae el newline
+		if (this.#needed === 0 && this.#length !== data.byteLength && data.indexOf(0x0a) === -1) return [];
+
+		const buffer = this.#chunks.length === 1 ? this.#chunks[0] : Buffer.concat(this.#chunks, this.#length);
+		const { frames, rest } = decodeFrames(buffer);
+		this.#chunks = rest.byteLength ? [rest] : [];
+		this.#length = rest.byteLength;
+		this.#needed = FrameReader.#pendingFrameSize(rest);
+		return frames;
+	}
+
+	static #pendingFrameSize(rest: Buffer): number {
+		if (!rest.byteLength || rest[0] !== BINARY_FRAME_MAGIC) return 0;
+		if (rest.byteLength < BINARY_FRAME_PREFIX_SIZE) return BINARY_FRAME_PREFIX_SIZE;
+		return BINARY_FRAME_PREFIX_SIZE + rest.readUInt32LE(1) + rest.readUInt32LE(5);
+	}
+}
+
 /**
  * Configuración para crear un servidor IPC
  */
@@ -166,29 +260,22 @@ class IPCManager {
 		const pipePath = IPCManager.getPipePath(moduleName, moduleVersion, language);
 		const client = new net.Socket();
 
-		let buffer = "";
+		const reader = new FrameReader();
 
 		// Manejar respuestas
-		client.on("data", (data) => {
-			buffer += data.toString();
-
-			const messages = buffer.split("\n");
-			buffer = messages.pop() || "";
-
-			for (const msgStr of messages) {
-				if (!msgStr.trim()) continue;
-
+		client.on("data", (data: Buffer) => {
+			for (const frame of reader.push(data)) {
 				try {
-					const message: IPCMessage = JSON.parse(msgStr);
+					const message: IPCMessage = JSON.parse(frame.header);
 					const pending = this.pendingRequests.get(message.id);
 
 					if (pending) {
 						this.pendingRequests.delete(message.id);
 						if (message.type === "response") {
-							// Deserializar buffers si vienen en formato base64
+							// Deserializar buffers (base64 en tramas legacy, blobs crudos en tramas binarias)
 							let result = message.result;
 							if (result && typeof result === "object" && result.__type === "Buffer") {
-								result = Buffer.from(result.data, "base64");
+								result = frame.blobs ? Buffer.from(frame.blobs.subarray(0, result.len)) : Buffer.from(result.data, "base64");
 							}
 							pending.resolve(result);
 						} else if (message.type === "error") {
@@ -230,8 +317,14 @@ class IPCManager {
 		const client = await this.getOrCreateClient(moduleName, moduleVersion, language);
 
 		// Serializar buffers en los argumentos
+		const binary = BINARY_FRAME_LANGUAGES.has(language);
+		const blobs: Buffer[] = [];
 		const serializedArgs = args.map((arg) => {
 			if (Buffer.isBuffer(arg)) {
+				if (binary) {
+					blobs.push(arg);
+					return { __type: "Buffer", idx: blobs.length - 1, len: arg.byteLength };
+				}
 				return { __type: "Buffer", data: arg.toString("base64") };
 			}
 			return arg;
@@ -250,7 +343,7 @@ class IPCManager {
 			this.pendingRequests.set(messageId, { resolve, reject });
 
 			// Enviar el mensaje
-			client.write(JSON.stringify(message) + "\n");
+			client.write(binary ? encodeBinaryFrame(message, blobs) : JSON.stringify(message) + "\n");
 
 			// Timeout de 30 segundos
 			setTimeout(() => {
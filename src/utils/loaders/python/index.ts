@@ -173,10 +173,14 @@ export default class PythonLoader implements IModuleLoader {
 			ADC_MODULE_VERSION: moduleVersion,
 			ADC_MODULE_TYPE: moduleType,
 			ADC_MODULE_CONFIG: JSON.stringify(config || {}),
+			// Mismo nivel que el Logger del kernel, para que el KernelLogger de Python no filtre de más
+			ADC_LOG_LEVEL: process.env.ADC_LOG_LEVEL || process.env.LOG_LEVEL || "DEBUG",
 			PYTHONPATH: pythonPath,
 		};
 
-		const pythonProcess = spawn("/usr/bin/python3", [indexFile], {
+		// ADC_PYTHON_BIN permite usar un venv con las dependencias de interop/py/requirements.txt
+		const pythonBin = process.env.ADC_PYTHON_BIN || "/usr/bin/python3";
+		const pythonProcess = spawn(pythonBin, [indexFile], {
 			env,
 			stdio: ["pipe", "pipe", "pipe"],
 		});
@@ -198,8 +202,8 @@ export default class PythonLoader implements IModuleLoader {
 	}
 
 	private setupProcessLogging(process: ChildProcess, moduleName: string) {
-		const logHandler = (data: Buffer) => {
-			const msg = data.toString().trim();
+		const logLine = (line: string) => {
+			const msg = line.trim();
 			if (!msg) return;
 
 			const match = msg.match(/^\[(DEBUG|INFO|OK|WARN|ERROR)\]\s+(.*)/i);
@@ -232,8 +236,19 @@ export default class PythonLoader implements IModuleLoader {
 			}
 		};
 
-		process.stdout?.on("data", logHandler);
-		process.stderr?.on("data", logHandler);
+		// Un chunk puede traer varias líneas (el KernelLogger escribe en lote) o cortar una a la mitad
+		const attach = (stream: NodeJS.ReadableStream | null) => {
+			let pending = "";
+			stream?.on("data", (data: Buffer) => {
+				const lines = (pending + data.toString()).split("\n");
+				pending = lines.pop() ?? "";
+				lines.forEach(logLine);
+			});
+			stream?.on("end", () => logLine(pending));
+		};
+
+		attach(process.stdout);
+		attach(process.stderr);
 	}
 
 	// Limpieza de referencias si el proceso muere solo